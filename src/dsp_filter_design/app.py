@@ -1,11 +1,13 @@
 import os
+from functools import lru_cache
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, Input, Output, State, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import dsp_filter_design.dsp_utils as dsp
 import numpy as np
+import plotly.io as pio
 
-# --- Constants ---
 # --- Constants ---
 LSC_BLUE = "#003262"  # Professional LSC Blue
 
@@ -27,339 +29,472 @@ CONFIG_PLOT = {
     "modeBarButtonsToRemove": ["toImage", "sendDataToCloud", "pan2d", "select2d", "lasso2d", "zoomIn2d", "zoomOut2d", "autoScale2d", "resetScale2d"]
 }
 
+# Only the P/Z map needs shape dragging; the response plots are read-only so
+# they never emit relayout edits
+CONFIG_PLOT_READONLY = {**CONFIG_PLOT, "editable": False,
+                        "edits": {k: False for k in CONFIG_PLOT["edits"]}}
+
+# Filter state is stored as parallel real/imag arrays (struct of arrays) so
+# callbacks can hand them straight to NumPy and Plotly without unpacking pairs.
+# Each array travels as a base64 typed array to keep the store payload small.
+# States produced by a design also carry its parameters as "design_key"; edits
+# and drags drop it since the roots no longer match that design.
+ROOT_KEYS = ("poles_re", "poles_im", "zeros_re", "zeros_im")
+EMPTY_STATE = {**{key: dsp.encode_array([]) for key in ROOT_KEYS}, "gain": 1.0}
+
 # --- App Initialization ---
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.LUX])
 app.title = "DSP Explorer"
 server = app.server
 
+# Dash serializes callback responses through plotly's JSON encoder; orjson
+# encodes the NumPy figure arrays in C instead of per-float Python formatting
+pio.json.config.default_engine = "orjson"
+
+# Compile JIT kernels now so the first user request doesn't pay for it
+dsp.warmup()
+
+# --- Filter State Helpers ---
+def _pack_state(roots, gain):
+    """Encode the real/imag root arrays for the filter-state store."""
+    state = {key: dsp.encode_array(roots[key]) for key in ROOT_KEYS}
+    state["gain"] = float(gain)
+    return state
+
+
+def _unpack_roots(data):
+    """Decode the real/imag root arrays (read-only) from the store."""
+    return {key: dsp.decode_array(data[key]) for key in ROOT_KEYS}
+
+
+@lru_cache(maxsize=256)
+def _design_state_cached(fam, ftype, order, domain, c1, c2):
+    # Arguments are hashable scalars. The packed store dict is cached, so a
+    # hit skips SciPy and the base64 encoding; it is only read, never mutated
+    z, p, k = dsp.design_filter(fam, ftype, order, domain, c1, c2)
+    state = _pack_state({"poles_re": p.real, "poles_im": p.imag,
+                         "zeros_re": z.real, "zeros_im": z.imag}, k)
+    state["design_key"] = [fam, ftype, order, domain, c1, c2]
+    return state
+
+
+# Designs for the commonly explored combinations at the default cutoffs
+# (cut1 as set by update_defaults, cut2 left at its initial 2.0), computed at
+# import so they never reach SciPy at request time
+_DEFAULT_CUTOFFS = {"analog": (1.0, 2.0), "digital": (0.25, 2.0)}
+_DESIGN_LUT = {
+    (fam, ftype, order, domain, *cuts): _design_state_cached(fam, ftype, order, domain, *cuts)
+    for fam in ("Butterworth", "Chebyshev I", "Chebyshev II", "Bessel")
+    for ftype in ("low", "high")
+    for order in (2, 4, 6, 8)
+    for domain, cuts in _DEFAULT_CUTOFFS.items()
+}
+
+
+def _round_cutoff(c):
+    # 9 significant digits, so float noise from the inputs still hits the cache
+    return c if c is None else float(f"{c:.9g}")
+
+
+def _design_state(fam, ftype, order, domain, c1, c2):
+    key = (fam, ftype, order, domain, _round_cutoff(c1), _round_cutoff(c2))
+    return _DESIGN_LUT.get(key) or _design_state_cached(*key)
+
+
+# Default design matching the initial control values, computed once at import
+# so the first page load doesn't need a design callback round-trip
+DEFAULT_STATE = _design_state("Butterworth", "low", 4, "analog", 1.0, 2.0)
+
 # --- Layout Components ---
-header = dbc.Navbar(
-    dbc.Container(
-        [
-            html.A(
-                dbc.Row(
-                    [
-                        dbc.Col(html.Img(src="/assets/lsc-logo-small.png", height="40px")),
-                        dbc.Col(dbc.NavbarBrand("DSP Filter Design Explorer", className="ms-2")),
-                    ],
-                    align="center",
-                    className="g-0",
+# Served as a layout function so Dash calls it per page load; the cache hands
+# back the same component tree instead of rebuilding it each time
+@lru_cache(maxsize=1)
+def build_layout():
+    header = dbc.Navbar(
+        dbc.Container(
+            [
+                html.A(
+                    dbc.Row(
+                        [
+                            dbc.Col(html.Img(src="/assets/lsc-logo-small.png", height="40px")),
+                            dbc.Col(dbc.NavbarBrand("DSP Filter Design Explorer", className="ms-2")),
+                        ],
+                        align="center",
+                        className="g-0",
+                    ),
+                    href="#",
+                    style={"textDecoration": "none"},
                 ),
-                href="#",
-                style={"textDecoration": "none"},
+            ]
+        ),
+        color=LSC_BLUE,
+
+        dark=True,
+        className="mb-4",
+    )
+
+    explainer = dbc.Accordion(
+        [
+            dbc.AccordionItem(
+                [
+                    html.P("This application serves as a pedagogical tool for exploring digital filter design principles."),
+                    html.P("Key Features:"),
+                    html.Ul([
+                        html.Li("Visualize poles and zeros in both Analog (s-plane) and Digital (z-plane) domains."),
+                        html.Li("Design common filters (Butterworth, Chebyshev, etc.) and observe their frequency and impulse responses."),
+                        html.Li("Understand stability and causality regions (ROC) with interactive highlighting."),
+                        html.Li("Compare 'Causal' vs 'Anti-Causal' system behaviors.")
+                    ]),
+                    html.P("Use the control panel on the left to configure your filter, and drag poles/zeros on the chart to fine-tune your design."),
+                ],
+                title="About this App (How to Use)",
             ),
-        ]
-    ),
-    color=LSC_BLUE,
+        ],
+        start_collapsed=True,
+        className="mb-4",
+    )
+
+    control_panel = dbc.Card([
+        dbc.CardHeader("Filter Design Parameters"),
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    html.Label("Domain"),
+                    dbc.RadioItems(
+                        id="domain-radio",
+                        options=[{"label": "Analog (s)", "value": "analog"},
+                                 {"label": "Digital (z)", "value": "digital"}],
+                        value="analog",
+                        inputClassName="btn-check",
+                        labelClassName="btn btn-outline-primary btn-sm",
+                        labelCheckedClassName="active"
+                    ),
+                ], width=12, className="mb-3"),
+
+                dbc.Col([
+                    html.Label("Family"),
+                    dcc.Dropdown(
+                        id="family-dd",
+                        options=["Butterworth", "Chebyshev I", "Chebyshev II", "Elliptic",
+                                 "Bessel", "Custom"],
+                        value="Butterworth", clearable=False
+                    )
+                ], width=6),
+                dbc.Col([
+                    html.Label("Type"),
+                    dcc.Dropdown(
+                        id="type-dd",
+                        options=[
+                            {"label": "Lowpass", "value": "low"},
+                            {"label": "Highpass", "value": "high"},
+                            {"label": "Bandpass", "value": "bandpass"},
+                            {"label": "Bandstop", "value": "bandstop"}
+                        ],
+                        value="low", clearable=False
+                    )
+                ], width=6),
+            ], className="mb-2"),
+
+            dbc.Row([
+                dbc.Col([
+                    html.Label("Order"),
+                    dbc.Input(id="order-in", type="number", value=4, min=1, step=1)
+                ], width=4),
+                dbc.Col([
+                    html.Label("Cutoff 1"),
+                    dbc.Input(id="cut1-in", type="number", value=1.0, step=0.1)
+                ], width=4),
+                dbc.Col([
+                    html.Label("Cutoff 2"),
+                    dbc.Input(id="cut2-in", type="number", value=2.0, step=0.1,
+                              disabled=True)
+                ], width=4),
+            ], className="mb-3"),
 
-    dark=True,
-    className="mb-4",
-)
+            html.Hr(),
 
-explainer = dbc.Accordion(
-    [
-        dbc.AccordionItem(
-            [
-                html.P("This application serves as a pedagogical tool for exploring digital filter design principles."),
-                html.P("Key Features:"),
-                html.Ul([
-                    html.Li("Visualize poles and zeros in both Analog (s-plane) and Digital (z-plane) domains."),
-                    html.Li("Design common filters (Butterworth, Chebyshev, etc.) and observe their frequency and impulse responses."),
-                    html.Li("Understand stability and causality regions (ROC) with interactive highlighting."),
-                    html.Li("Compare 'Causal' vs 'Anti-Causal' system behaviors.")
-                ]),
-                html.P("Use the control panel on the left to configure your filter, and drag poles/zeros on the chart to fine-tune your design."),
-            ],
-            title="About this App (How to Use)",
-        ),
-    ],
-    start_collapsed=True,
-    className="mb-4",
-)
+            # ROC Toggle
+            html.Label("Highlight Region (Stability)"),
+            dbc.RadioItems(
+                id="roc-radio",
+                options=[
+                    {"label": "Causal", "value": "causal"},
+                    {"label": "Anti-Causal", "value": "anticausal"},
+                    {"label": "Off", "value": "off"}
+                ],
+                value="causal",
+                inline=True,
+                className="mb-3"
+            ),
 
-control_panel = dbc.Card([
-    dbc.CardHeader("Filter Design Parameters"),
-    dbc.CardBody([
-        dbc.Row([
-            dbc.Col([
-                html.Label("Domain"),
-                dbc.RadioItems(
-                    id="domain-radio",
-                    options=[{"label": "Analog (s)", "value": "analog"},
-                             {"label": "Digital (z)", "value": "digital"}],
-                    value="analog",
-                    inputClassName="btn-check",
-                    labelClassName="btn btn-outline-primary btn-sm",
-                    labelCheckedClassName="active"
-                ),
-            ], width=12, className="mb-3"),
-
-            dbc.Col([
-                html.Label("Family"),
-                dcc.Dropdown(
-                    id="family-dd",
-                    options=["Butterworth", "Chebyshev I", "Chebyshev II", "Elliptic",
-                             "Bessel", "Custom"],
-                    value="Butterworth", clearable=False
-                )
-            ], width=6),
-            dbc.Col([
-                html.Label("Type"),
-                dcc.Dropdown(
-                    id="type-dd",
-                    options=[
-                        {"label": "Lowpass", "value": "low"},
-                        {"label": "Highpass", "value": "high"},
-                        {"label": "Bandpass", "value": "bandpass"},
-                        {"label": "Bandstop", "value": "bandstop"}
-                    ],
-                    value="low", clearable=False
-                )
-            ], width=6),
-        ], className="mb-2"),
+            # Buttons
+            dbc.Row([
+                dbc.Col(dbc.Button("Add Pole", id="btn-add-p", outline=True, color="danger",
+                                   size="sm", className="w-100"), width=6),
+                dbc.Col(dbc.Button("Rem Pole", id="btn-rem-p", outline=True, color="danger",
+                                   size="sm", className="w-100"), width=6),
+            ], className="mb-2"),
+            dbc.Row([
+                dbc.Col(
+                    dbc.Button("Add Zero", id="btn-add-z", outline=True, color="primary",
+                               size="sm", className="w-100"), width=6),
+                dbc.Col(
+                    dbc.Button("Rem Zero", id="btn-rem-z", outline=True, color="primary",
+                               size="sm", className="w-100"), width=6),
+            ], className="mb-2"),
+
+            dbc.Button("Reset All", id="btn-reset", outline=True, color="secondary",
+                       size="sm", className="w-100"),
+
+        ])
+    ], className="h-100 shadow-sm")
 
+    plots_col = html.Div([
         dbc.Row([
-            dbc.Col([
-                html.Label("Order"),
-                dbc.Input(id="order-in", type="number", value=4, min=1, step=1)
-            ], width=4),
-            dbc.Col([
-                html.Label("Cutoff 1"),
-                dbc.Input(id="cut1-in", type="number", value=1.0, step=0.1)
-            ], width=4),
-            dbc.Col([
-                html.Label("Cutoff 2"),
-                dbc.Input(id="cut2-in", type="number", value=2.0, step=0.1,
-                          disabled=True)
-            ], width=4),
-        ], className="mb-3"),
-
-        html.Hr(),
-
-        # ROC Toggle
-        html.Label("Highlight Region (Stability)"),
-        dbc.RadioItems(
-            id="roc-radio",
-            options=[
-                {"label": "Causal", "value": "causal"},
-                {"label": "Anti-Causal", "value": "anticausal"},
-                {"label": "Off", "value": "off"}
+            dbc.Col(dbc.Card([
+                dbc.CardHeader("Pole-Zero Map", className="p-1 text-center"),
+                # Static ROC/reference layer underneath the transparent,
+                # draggable pole/zero layer
+                dbc.CardBody([
+                    dcc.Graph(id="pz-bg", config={**CONFIG_PLOT_READONLY, "staticPlot": True},
+                              style={"position": "absolute", "inset": 0}),
+                    dcc.Graph(id="pz-plot", config=CONFIG_PLOT, style={"position": "relative"}),
+                ], className="p-0", style={"position": "relative"})
+            ]), md=6),
+            dbc.Col(dbc.Card([
+                dbc.CardHeader("Bode Plot", className="p-1 text-center"),
+                dbc.CardBody(dcc.Graph(id="bode-plot", config=CONFIG_PLOT_READONLY), className="p-0")
+            ]), md=6),
+        ], className="mb-2 g-2"),
+        dbc.Row([
+            dbc.Col(dbc.Card([
+                dbc.CardHeader("Impulse Response", className="p-1 text-center"),
+                dbc.CardBody(dcc.Graph(id="impulse-plot", config=CONFIG_PLOT_READONLY), className="p-0")
+            ]), width=12)
+        ], className="g-2")
+    ])
+
+
+    footer = html.Footer(
+        dbc.Container(
+            [
+                html.Hr(),
+                html.P("© 2026 James Kennington. All Rights Reserved.", className="text-center text-muted"),
             ],
-            value="causal",
-            inline=True,
-            className="mb-3"
+            fluid=True,
         ),
+        className="mt-5"
+    )
 
-        # Buttons
+    return dbc.Container([
+        header,
+        explainer,
         dbc.Row([
-            dbc.Col(dbc.Button("Add Pole", id="btn-add-p", outline=True, color="danger",
-                               size="sm", className="w-100"), width=6),
-            dbc.Col(dbc.Button("Rem Pole", id="btn-rem-p", outline=True, color="danger",
-                               size="sm", className="w-100"), width=6),
-        ], className="mb-2"),
-        dbc.Row([
-            dbc.Col(
-                dbc.Button("Add Zero", id="btn-add-z", outline=True, color="primary",
-                           size="sm", className="w-100"), width=6),
-            dbc.Col(
-                dbc.Button("Rem Zero", id="btn-rem-z", outline=True, color="primary",
-                           size="sm", className="w-100"), width=6),
-        ], className="mb-2"),
+            dbc.Col(control_panel, md=3),
+            dbc.Col(plots_col, md=9)
+        ]),
+        footer,
+        dcc.Store(id="filter-state", data=DEFAULT_STATE),
+        dcc.Store(id="pz-relayout")
+    ], fluid=True, className="p-0")
 
-        dbc.Button("Reset All", id="btn-reset", outline=True, color="secondary",
-                   size="sm", className="w-100"),
 
-    ])
-], className="h-100 shadow-sm")
-
-plots_col = html.Div([
-    dbc.Row([
-        dbc.Col(dbc.Card([
-            dbc.CardHeader("Pole-Zero Map", className="p-1 text-center"),
-            dbc.CardBody(dcc.Graph(id="pz-plot", config=CONFIG_PLOT), className="p-0")
-        ]), md=6),
-        dbc.Col(dbc.Card([
-            dbc.CardHeader("Bode Plot", className="p-1 text-center"),
-            dbc.CardBody(dcc.Graph(id="bode-plot", config=CONFIG_PLOT), className="p-0")
-        ]), md=6),
-    ], className="mb-2 g-2"),
-    dbc.Row([
-        dbc.Col(dbc.Card([
-            dbc.CardHeader("Impulse Response", className="p-1 text-center"),
-            dbc.CardBody(dcc.Graph(id="impulse-plot", config=CONFIG_PLOT), className="p-0")
-        ]), width=12)
-    ], className="g-2")
-])
-
-
-
-
-footer = html.Footer(
-    dbc.Container(
-        [
-            html.Hr(),
-            html.P("© 2026 James Kennington. All Rights Reserved.", className="text-center text-muted"),
-        ],
-        fluid=True,
-    ),
-    className="mt-5"
-)
-
-app.layout = dbc.Container([
-    header,
-    explainer,
-    dbc.Row([
-        dbc.Col(control_panel, md=3),
-        dbc.Col(plots_col, md=9)
-    ]),
-    footer,
-    dcc.Store(id="filter-state", data={"poles": [], "zeros": [], "gain": 1.0})
-], fluid=True, className="p-0")
+app.layout = build_layout
 
 
 # --- Callbacks ---
 
 # 1. Update Input Defaults based on Domain
+# Separate callbacks per input, so neither needs to inspect its trigger
 @app.callback(
     Output("cut1-in", "value"),
-    Output("cut2-in", "disabled"),
     Input("domain-radio", "value"),
-    Input("type-dd", "value"),
-    State("cut1-in", "value")
+    prevent_initial_call=True
 )
-def update_defaults(domain, ftype, current_c1):
-    ctx = callback_context
-    trigger = ctx.triggered[0]["prop_id"].split(".")[0] if ctx.triggered else "init"
-
-    c2_disabled = ftype not in ["bandpass", "bandstop"]
+def update_cutoff_default(domain):
+    if domain == "digital":
+        # Switch to normalized freq
+        return 0.25
+    # Switch to rad/s
+    return 1.0
 
-    new_c1 = current_c1
-    if trigger == "domain-radio":
-        if domain == "digital":
-            # Switch to normalized freq
-            new_c1 = 0.25
-        else:
-            # Switch to rad/s
-            new_c1 = 1.0
 
-    return new_c1, c2_disabled
+@app.callback(
+    Output("cut2-in", "disabled"),
+    Input("type-dd", "value"),
+    prevent_initial_call=True
+)
+def update_cutoff2_enabled(ftype):
+    return ftype not in ["bandpass", "bandstop"]
 
 
 # 2. Main Logic: Update Filter State
+# Split by trigger so each UI event only does the work it needs: parameter
+# widgets redesign the filter, buttons edit the lists, drags move one root.
+
+# 2a. Design from Parameters
 @app.callback(
     Output("filter-state", "data"),
     Input("family-dd", "value"), Input("type-dd", "value"),
     Input("order-in", "value"),
     Input("cut1-in", "value"), Input("cut2-in", "value"),
-    Input("btn-add-p", "n_clicks"), Input("btn-add-z", "n_clicks"),
-    Input("btn-rem-p", "n_clicks"), Input("btn-rem-z", "n_clicks"),
+    Input("domain-radio", "value"),
+    State("filter-state", "data"),
+    prevent_initial_call=True
+)
+def update_filter_design(fam, ftype, order, c1, c2, domain, current_data):
+    if fam == "Custom":
+        raise PreventUpdate
+    # Inputs re-emitting the same values (e.g. focus changes) are a no-op.
+    # Stored keys hold rounded cutoffs, so round before comparing
+    key = [fam, ftype, order, domain, _round_cutoff(c1), _round_cutoff(c2)]
+    if current_data.get("design_key") == key:
+        raise PreventUpdate
+    return _design_state(fam, ftype, order, domain, c1, c2)
+
+
+# 2b. Manual Add / Remove / Reset
+# One callback per button, so Dash's dependency graph routes the click and no
+# trigger detection is needed. Stored real/imag arrays are edited directly;
+# no complex rebuild needed.
+def _add_root(data, kind, re, im):
+    roots = _unpack_roots(data)
+    roots[kind + "_re"] = np.append(roots[kind + "_re"], re)
+    roots[kind + "_im"] = np.append(roots[kind + "_im"], im)
+    return _pack_state(roots, data["gain"])
+
+
+def _remove_root(data, kind):
+    roots = _unpack_roots(data)
+    if len(roots[kind + "_re"]) == 0:
+        raise PreventUpdate
+    roots[kind + "_re"] = roots[kind + "_re"][:-1]
+    roots[kind + "_im"] = roots[kind + "_im"][:-1]
+    return _pack_state(roots, data["gain"])
+
+
+@app.callback(
+    Output("filter-state", "data", allow_duplicate=True),
+    Input("btn-add-p", "n_clicks"),
+    State("domain-radio", "value"), State("filter-state", "data"),
+    prevent_initial_call=True
+)
+def add_pole(_, domain, current_data):
+    return _add_root(current_data, "poles", -0.5 if domain == "analog" else 0.5, 0.5)
+
+
+@app.callback(
+    Output("filter-state", "data", allow_duplicate=True),
+    Input("btn-add-z", "n_clicks"),
+    State("filter-state", "data"),
+    prevent_initial_call=True
+)
+def add_zero(_, current_data):
+    return _add_root(current_data, "zeros", 0.0, 0.5)
+
+
+@app.callback(
+    Output("filter-state", "data", allow_duplicate=True),
+    Input("btn-rem-p", "n_clicks"),
+    State("filter-state", "data"),
+    prevent_initial_call=True
+)
+def remove_pole(_, current_data):
+    return _remove_root(current_data, "poles")
+
+
+@app.callback(
+    Output("filter-state", "data", allow_duplicate=True),
+    Input("btn-rem-z", "n_clicks"),
+    State("filter-state", "data"),
+    prevent_initial_call=True
+)
+def remove_zero(_, current_data):
+    return _remove_root(current_data, "zeros")
+
+
+@app.callback(
+    Output("filter-state", "data", allow_duplicate=True),
     Input("btn-reset", "n_clicks"),
-    Input("pz-plot", "relayoutData"),
+    State("family-dd", "value"), State("type-dd", "value"),
+    State("order-in", "value"),
+    State("cut1-in", "value"), State("cut2-in", "value"),
     State("domain-radio", "value"),
-    State("roc-radio", "value"), # Added for shape offset calculation
-    State("filter-state", "data")
+    prevent_initial_call=True
 )
-def update_filter_state(fam, ftype, order, c1, c2,
-                        add_p, add_z, rem_p, rem_z, btn_rst,
-                        relayout, domain, roc_mode, current_data):
-    ctx = callback_context
-    trigger = ctx.triggered[0]["prop_id"].split(".")[0] if ctx.triggered else "init"
-
-    poles = [complex(p[0], p[1]) for p in current_data.get("poles", [])]
-    zeros = [complex(z[0], z[1]) for z in current_data.get("zeros", [])]
-    gain = current_data.get("gain", 1.0)
-
-    # Design Triggers
-    design_triggers = ["family-dd", "type-dd", "order-in", "cut1-in", "cut2-in",
-                       "btn-reset"]
-    if trigger in design_triggers or trigger == "init":
-        if fam != "Custom":
-            z, p, k = dsp.design_filter(fam, ftype, order, domain, c1, c2)
-            zeros, poles, gain = list(z), list(p), float(k)
-        elif trigger == "btn-reset":
-            zeros, poles, gain = [], [], 1.0
-
-    # Manual Add
-    if trigger == "btn-add-p":
-        poles.append(complex(-0.5, 0.5) if domain == "analog" else complex(0.5, 0.5))
-    if trigger == "btn-add-z":
-        zeros.append(complex(0, 0.5) if domain == "analog" else complex(0, 0.5))
-
-    # Manual Remove
-    if trigger == "btn-rem-p" and poles:
-        poles.pop()
-    if trigger == "btn-rem-z" and zeros:
-        zeros.pop()
-
-    # Dragging
-    if trigger == "pz-plot" and relayout:
-        # Calculate Offset for Background Shapes
-        # 1. Stability Region (if enabled) -> 1 shape
-        # 2. Reference Line -> 1 shape
-        # offset = (1 if roc_mode != "off" else 0) + 1
-        offset = 1 + (1 if roc_mode != "off" else 0)
-        
-        n_zeros = len(zeros)
-        for key, val in relayout.items():
-            if "shapes[" in key:
-                try:
-                    shape_idx = int(key.split("[")[1].split("]")[0])
-                    attr = key.split(".")[-1]
-                    logic_idx = shape_idx - offset
-                    radius = 0.05
-
-                    if 0 <= logic_idx < n_zeros:
-                        curr_z = zeros[logic_idx]
-                        if attr == "x0":
-                            zeros[logic_idx] = complex(val + radius, curr_z.imag)
-                        elif attr == "x1":
-                            zeros[logic_idx] = complex(val - radius, curr_z.imag)
-                        elif attr == "y0":
-                            zeros[logic_idx] = complex(curr_z.real, val + radius)
-                        elif attr == "y1":
-                            zeros[logic_idx] = complex(curr_z.real, val - radius)
-                    elif logic_idx >= n_zeros:
-                        p_idx = logic_idx - n_zeros
-                        if p_idx < len(poles):
-                            curr_p = poles[p_idx]
-                            if attr == "x0":
-                                poles[p_idx] = complex(val + radius, curr_p.imag)
-                            elif attr == "x1":
-                                poles[p_idx] = complex(val - radius, curr_p.imag)
-                            elif attr == "y0":
-                                poles[p_idx] = complex(curr_p.real, val + radius)
-                            elif attr == "y1":
-                                poles[p_idx] = complex(curr_p.real, val - radius)
-                except Exception as e:
-                    print(f"Drag parse error: {e}")
-
-    return dsp.sanitize_json({
-        "poles": [[p.real, p.imag] for p in poles],
-        "zeros": [[z.real, z.imag] for z in zeros],
-        "gain": gain
-    })
-
-
-# 3a. Update Response Plots (Bode + Impulse)
+def reset_filter(_, fam, ftype, order, c1, c2, domain):
+    if fam != "Custom":
+        return _design_state(fam, ftype, order, domain, c1, c2)
+    return EMPTY_STATE
+
+
+# 2c. Dragging
+# Handled clientside (assets/pz.js): moving a root is simple arithmetic, so
+# it never needs a server round-trip. plotly.js fires relayoutData on every
+# pixel of a drag; the throttle coalesces them into at most one pz-relayout
+# write per 60 ms so the response plots don't recompute for every sample.
+app.clientside_callback(
+    ClientsideFunction(namespace="pz", function_name="throttleRelayout"),
+    Output("pz-relayout", "data"),
+    Input("pz-plot", "relayoutData"),
+    prevent_initial_call=True
+)
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="pz", function_name="applyDrag"),
+    Output("filter-state", "data", allow_duplicate=True),
+    Input("pz-relayout", "data"),
+    State("filter-state", "data"),
+    prevent_initial_call=True
+)
+
+
+# 3. Response Plots
+# Bode and Impulse are separate callbacks sharing one memoized computation,
+# so each figure is rebuilt and shipped on its own.
+@lru_cache(maxsize=64)
+def _responses_cached(root_bdata, gain, domain):
+    roots = {key: dsp.decode_array({"dtype": "f8", "bdata": bdata})
+             for key, bdata in zip(ROOT_KEYS, root_bdata)}
+    poles = dsp.to_complex_array(roots["poles_re"], roots["poles_im"])
+    zeros = dsp.to_complex_array(roots["zeros_re"], roots["zeros_im"])
+    responses = dsp.compute_responses(zeros, poles, gain, domain)
+    # Cached arrays are shared between calls; keep them read-only
+    for arr in responses:
+        if arr is not None:
+            arr.flags.writeable = False
+    return responses
+
+
+def _responses(data, domain):
+    """Memoized dsp.compute_responses for the stored filter.
+
+    Keyed on the stored base64 strings as-is, so a cache hit skips decoding
+    the roots entirely."""
+    root_bdata = tuple(data[key]["bdata"] for key in ROOT_KEYS)
+    return _responses_cached(root_bdata, float(data["gain"]), domain)
+
+
+# 3a. Update Bode Plot
 # Depends on: Filter State, Domain
 @app.callback(
-    Output("bode-plot", "figure"), Output("impulse-plot", "figure"),
+    Output("bode-plot", "figure"),
     Input("filter-state", "data"), Input("domain-radio", "value")
 )
-def update_response_plots(data, domain):
-    poles = dsp.to_complex_array(data["poles"])
-    zeros = dsp.to_complex_array(data["zeros"])
-    gain = data["gain"]
-
-    w, mag, phase, t, y = dsp.compute_responses(zeros, poles, gain, domain)
+def update_bode(data, domain):
+    w, mag, phase, _, _ = _responses(data, domain)
+    # float32 typed arrays, decoded natively by plotly.js
+    w, mag, phase = (dsp.encode_array(a, "f4") for a in (w, mag, phase))
 
-    # -- Bode --
     bode_fig = {
         "data": [
-            {"x": w, "y": mag, "name": "Mag", "line": {"color": LSC_BLUE}},
+            # WebGL line traces; the 500-point curves skip SVG path layout
+            {"type": "scattergl", "mode": "lines", "x": w, "y": mag, "name": "Mag",
+             "line": {"color": LSC_BLUE}},
 
-            {"x": w, "y": phase, "name": "Phase", "yaxis": "y2",
-             "line": {"color": "orange", "dash": "dot"}}
+            {"type": "scattergl", "mode": "lines", "x": w, "y": phase, "name": "Phase",
+             "yaxis": "y2", "line": {"color": "orange", "dash": "dot"}}
         ],
         "layout": {
             "title": "Bode Plot",
@@ -374,7 +509,18 @@ def update_response_plots(data, domain):
         }
     }
 
-    # -- Impulse --
+    return bode_fig
+
+
+# 3b. Update Impulse Plot
+# Depends on: Filter State, Domain
+@app.callback(
+    Output("impulse-plot", "figure"),
+    Input("filter-state", "data"), Input("domain-radio", "value")
+)
+def update_impulse(data, domain):
+    _, _, _, t, y = _responses(data, domain)
+
     if y is None:
         imp_fig = {
             "data": [],
@@ -402,7 +548,9 @@ def update_response_plots(data, domain):
 
         imp_fig = {
             "data": [
-                {"x": t, "y": y, "type": "bar" if domain == "digital" else "scatter",
+                {"x": dsp.encode_array(t, "f4"), "y": dsp.encode_array(y, "f4"),
+                 # No WebGL bars, but the digital response is only 101 samples
+                 "type": "bar" if domain == "digital" else "scattergl",
                  "marker": {"color": "#333"}}],
             "layout": {
                 "title": "Impulse Response",
@@ -427,135 +575,24 @@ def update_response_plots(data, domain):
             }
         }
 
-    return bode_fig, imp_fig
+    return imp_fig
 
 
-# 3b. Update P/Z Map
-# Depends on: Filter State, Domain, ROC Toggle
-@app.callback(
-    Output("pz-plot", "figure"),
-    Input("filter-state", "data"), Input("domain-radio", "value"),
-    Input("roc-radio", "value")
+# 3c. Update P/Z Map
+# Rendered clientside (assets/pz.js) to skip the server round-trip.
+# Background layer depends on: Domain, ROC Toggle
+app.clientside_callback(
+    ClientsideFunction(namespace="pz", function_name="renderBackground"),
+    Output("pz-bg", "figure"),
+    Input("domain-radio", "value"), Input("roc-radio", "value")
 )
-def update_pz_map(data, domain, roc_mode):
-    poles = dsp.to_complex_array(data["poles"])
-    zeros = dsp.to_complex_array(data["zeros"])
-    
-    shapes = []
-
-    # 1. Background Regions (Stability/Causality)
-    if roc_mode != "off":
-        if domain == "analog":
-            if roc_mode == "causal":
-                # Green Left Half Plane
-                shapes.append({
-                    "type": "rect", "x0": -100, "x1": 0, "y0": -100, "y1": 100,
-                    "fillcolor": "rgba(0, 255, 0, 0.1)", "line": {"width": 0},
-                    "layer": "below", "editable": False
-                })
-            else:
-                # Red Right Half Plane
-                shapes.append({
-                    "type": "rect", "x0": 0, "x1": 100, "y0": -100, "y1": 100,
-                    "fillcolor": "rgba(255, 0, 0, 0.1)", "line": {"width": 0},
-                    "layer": "below", "editable": False
-                })
-        else:  # Digital
-            if roc_mode == "causal":
-                # Green Inside Unit Circle
-                shapes.append({
-                    "type": "circle", "x0": -1, "x1": 1, "y0": -1, "y1": 1,
-                    "fillcolor": "rgba(0, 255, 0, 0.1)", "line": {"width": 0},
-                    "layer": "below", "editable": False
-                })
-            else:
-                # Red Outside Unit Circle (Donut Hole)
-                # Method: Polygon Approximation + Bridge Path
-                # SVG Arcs can be flaky with winding rules in some renderers.
-                # A robust solution is to approximate the circle with a polygon (e.g. 64 sides)
-                # and use the same bridge topology.
-                #
-                # Path: Outer Box (CCW) -> Bridge In -> Inner Circle (CW Polygon) -> Bridge Out -> Close
-
-                # 1. Outer Box (CCW)
-                # (-20,-20) -> (20,-20) -> (20,20) -> (-20,20) -> (-20,-20)
-                outer = "M -20 -20 L 20 -20 L 20 20 L -20 20 L -20 -20"
-
-                # 2. Bridge In: From (-20, -20) to Top of Circle (0, 1)
-                bridge_in = "L 0 1"
-
-                # 3. Inner Circle Polygon (CW)
-                # Start at (0, 1), go CW to (0, 1)
-                # 64 segments = sufficient resolution for visual circle
-                angles = np.linspace(np.pi/2, -3*np.pi/2, 65) # 65 points for 64 segments (start==end)
-                circle_pts = []
-                for theta in angles[1:]: # Skip first point (0,1) as bridge_in lands there
-                    x = np.cos(theta)
-                    y = np.sin(theta)
-                    circle_pts.append(f"L {x:.5f} {y:.5f}")
-                
-                inner_poly = " ".join(circle_pts)
-
-                # 4. Bridge Out: From Top of Circle (0, 1) back to start (-20, -20)
-                bridge_out = "L -20 -20"
-
-                path_str = f"{outer} {bridge_in} {inner_poly} {bridge_out} Z"
-
-                shapes.append({
-                    "type": "path", "path": path_str,
-                    "fillcolor": "rgba(255, 0, 0, 0.1)", "line": {"width": 0},
-                    "layer": "below", "editable": False
-                })
-
-    # 2. Reference Lines
-    if domain == "digital":
-        shapes.append({
-            "type": "circle", "x0": -1, "x1": 1, "y0": -1, "y1": 1,
-            "line": {"dash": "dot", "color": "gray"}, "editable": False
-        })
-    else:
-        shapes.append({
-            "type": "line", "x0": 0, "x1": 0, "y0": -100, "y1": 100,
-            "line": {"color": "gray", "width": 1}, "editable": False
-        })
-
-    # 3. Zeros (Blue)
-    radius = 0.05
-    for z in zeros:
-        shapes.append({
-            "type": "circle",
-            "x0": z.real - radius, "x1": z.real + radius,
-            "y0": z.imag - radius, "y1": z.imag + radius,
-            "line": {"color": "blue", "width": 2},
-            "fillcolor": "rgba(0, 0, 255, 0.1)"
-        })
-
-    # 4. Poles (Red)
-    for p in poles:
-        shapes.append({
-            "type": "circle",
-            "x0": p.real - radius, "x1": p.real + radius,
-            "y0": p.imag - radius, "y1": p.imag + radius,
-            "line": {"color": "red", "width": 2},
-            "fillcolor": "rgba(255, 0, 0, 0.1)"
-        })
-
-    pz_fig = {
-        "data": [{"x": [-2, 2], "y": [-2, 2], "mode": "markers", "opacity": 0}],
-        "layout": {
-            "title": "Pole-Zero Map",
-            "height": 300,
-            "font": {"color": "black"},
-            "xaxis": {"range": [-2, 2], "title": {"text": "Real"}, "zeroline": False},
-            "yaxis": {"range": [-2, 2], "scaleanchor": "x", "scaleratio": 1,
-                      "title": {"text": "Imaginary"}, "zeroline": False},
-            "shapes": shapes,
-            "margin": {"l": 40, "r": 40, "t": 30, "b": 30},
-            "dragmode": "select"
-        }
-    }
 
-    return pz_fig
+# Pole/zero layer depends on: Filter State
+app.clientside_callback(
+    ClientsideFunction(namespace="pz", function_name="render"),
+    Output("pz-plot", "figure"),
+    Input("filter-state", "data")
+)
 
 
 def main():
@@ -0,0 +1,309 @@
+// Clientside rendering of the Pole-Zero map.
+// The figure is cheap to assemble, so it is built in the browser to avoid a
+// server round-trip on every state change, ROC toggle or drag.
+// It is drawn as two stacked graphs: a static background (ROC region and
+// reference line) that only changes with domain / ROC mode, and a transparent
+// foreground carrying just the poles and zeros.
+
+// Inner unit circle as a CW polygon (64 segments), starting after the top
+// point (0, 1) where the bridge lands. Fixed geometry, so built once.
+const CIRCLE_PATH = (function () {
+    const n = 64;
+    const pts = [];
+    for (let i = 1; i <= n; i++) {
+        const theta = Math.PI / 2 - (2 * Math.PI * i) / n;
+        pts.push(`L ${Math.cos(theta).toFixed(5)} ${Math.sin(theta).toFixed(5)}`);
+    }
+    return pts.join(" ");
+})();
+
+// Red Outside Unit Circle (Donut Hole)
+// Path: Outer Box (CCW) -> Bridge In -> Inner Circle (CW Polygon)
+//       -> Bridge Out -> Close
+const ANTICAUSAL_DIGITAL_PATH =
+    `M -20 -20 L 20 -20 L 20 20 L -20 20 L -20 -20 L 0 1 ${CIRCLE_PATH} L -20 -20 Z`;
+
+// Static background shapes, shared by reference across renders
+// Green Left Half Plane
+const LHP_GREEN = {
+    type: "rect", x0: -100, x1: 0, y0: -100, y1: 100,
+    fillcolor: "rgba(0, 255, 0, 0.1)", line: {width: 0},
+    layer: "below", editable: false
+};
+// Red Right Half Plane
+const RHP_RED = {
+    type: "rect", x0: 0, x1: 100, y0: -100, y1: 100,
+    fillcolor: "rgba(255, 0, 0, 0.1)", line: {width: 0},
+    layer: "below", editable: false
+};
+// Green Inside Unit Circle
+const UNIT_GREEN = {
+    type: "circle", x0: -1, x1: 1, y0: -1, y1: 1,
+    fillcolor: "rgba(0, 255, 0, 0.1)", line: {width: 0},
+    layer: "below", editable: false
+};
+// Red Outside Unit Circle
+const UNIT_RED = {
+    type: "path", path: ANTICAUSAL_DIGITAL_PATH,
+    fillcolor: "rgba(255, 0, 0, 0.1)", line: {width: 0},
+    layer: "below", editable: false
+};
+// Reference Lines: unit circle (z-plane) and imaginary axis (s-plane)
+const UNIT_REF = {
+    type: "circle", x0: -1, x1: 1, y0: -1, y1: 1,
+    line: {dash: "dot", color: "gray"}, editable: false
+};
+const IMAG_AXIS_REF = {
+    type: "line", x0: 0, x1: 0, y0: -100, y1: 100,
+    line: {color: "gray", width: 1}, editable: false
+};
+
+const PZ_RADIUS = 0.05;
+
+// Axes and geometry shared by both layers so they stay pixel-aligned
+const PZ_LAYOUT = {
+    title: "Pole-Zero Map",
+    height: 300,
+    font: {color: "black"},
+    xaxis: {range: [-2, 2], title: {text: "Real"}, zeroline: false},
+    yaxis: {range: [-2, 2], scaleanchor: "x", scaleratio: 1,
+            title: {text: "Imaginary"}, zeroline: false},
+    margin: {l: 40, r: 40, t: 30, b: 30}
+};
+
+// Decode a base64 typed array ({dtype: "f8", bdata}) from the filter-state store
+function decodeArray(obj) {
+    const bin = atob(obj.bdata);
+    const bytes = new Uint8Array(bin.length);
+    for (let i = 0; i < bin.length; i++) {
+        bytes[i] = bin.charCodeAt(i);
+    }
+    return Array.from(new Float64Array(bytes.buffer));
+}
+
+// Inverse of decodeArray, matching dsp_utils.encode_array
+function encodeArray(arr) {
+    const bytes = new Uint8Array(new Float64Array(arr).buffer);
+    let bin = "";
+    for (let i = 0; i < bytes.length; i++) {
+        bin += String.fromCharCode(bytes[i]);
+    }
+    return {dtype: "f8", bdata: btoa(bin)};
+}
+
+// Relayout keys emitted when a marker is dragged. Each edge maps back to the
+// root at the marker centre.
+const SHAPE_RE = /^shapes\[(\d+)\]\.(x0|x1|y0|y1)$/;
+const DRAG_EDGES = {
+    x0: {axis: "re", sign: 1}, x1: {axis: "re", sign: -1},
+    y0: {axis: "im", sign: 1}, y1: {axis: "im", sign: -1}
+};
+
+// Roots are drawn as two scattergl traces, so all markers render in one
+// WebGL pass instead of one SVG element each
+const ZERO_MARKER = {symbol: "circle-open", color: "blue", size: 14, line: {width: 2}};
+const POLE_MARKER = {symbol: "circle-open", color: "red", size: 14, line: {width: 2}};
+
+function markerTraces(roots) {
+    return [
+        {type: "scattergl", x: roots.zerosRe, y: roots.zerosIm, mode: "markers",
+         name: "Zeros", marker: ZERO_MARKER, hoverinfo: "x+y"},
+        {type: "scattergl", x: roots.polesRe, y: roots.polesIm, mode: "markers",
+         name: "Poles", marker: POLE_MARKER, hoverinfo: "x+y"}
+    ];
+}
+
+// plotly.js can drag shapes but not scatter points, so each root also gets an
+// invisible circle shape as its drag handle (opacity 0 still hit-tests).
+// Handles are shallow copies of one template written into a preallocated list.
+const HANDLE_TEMPLATE = {
+    type: "circle", x0: 0, x1: 0, y0: 0, y1: 0,
+    line: {width: 0}, fillcolor: "black", opacity: 0
+};
+
+// Zeros then poles, matching the index order applyDrag expects. They are
+// the only shapes on the foreground layer, so shape i is root i.
+function markerShapes(roots) {
+    const re = roots.zerosRe.concat(roots.polesRe);
+    const im = roots.zerosIm.concat(roots.polesIm);
+    const shapes = new Array(re.length);
+    for (let i = 0; i < re.length; i++) {
+        const d = Object.assign({}, HANDLE_TEMPLATE);
+        d.x0 = re[i] - PZ_RADIUS;
+        d.x1 = re[i] + PZ_RADIUS;
+        d.y0 = im[i] - PZ_RADIUS;
+        d.y1 = im[i] + PZ_RADIUS;
+        shapes[i] = d;
+    }
+    return shapes;
+}
+
+// Roots behind the current pz-plot figure, so render can patch it in place
+let renderedRoots = null;
+
+// Patch moving only the roots that differ between two same-sized root sets:
+// the marker trace point and the drag handle shape. Returns null if nothing
+// moved.
+function markerPatch(previous, roots) {
+    const patch = new window.dash_clientside.Patch();
+    const nZeros = roots.zerosRe.length;
+    let moved = false;
+    const kinds = [["zerosRe", "zerosIm", 0, 0], ["polesRe", "polesIm", 1, nZeros]];
+    for (const [reKey, imKey, trace, offset] of kinds) {
+        const re = roots[reKey];
+        const im = roots[imKey];
+        for (let j = 0; j < re.length; j++) {
+            if (re[j] === previous[reKey][j] && im[j] === previous[imKey][j]) {
+                continue;
+            }
+            const shape = ["layout", "shapes", offset + j];
+            patch.assign(["data", trace, "x", j], re[j])
+                .assign(["data", trace, "y", j], im[j])
+                .assign(shape.concat("x0"), re[j] - PZ_RADIUS)
+                .assign(shape.concat("x1"), re[j] + PZ_RADIUS)
+                .assign(shape.concat("y0"), im[j] - PZ_RADIUS)
+                .assign(shape.concat("y1"), im[j] + PZ_RADIUS);
+            moved = true;
+        }
+    }
+    return moved ? patch.build() : null;
+}
+
+// Drag relayouts are coalesced and forwarded to the pz-relayout store at
+// most once per DRAG_THROTTLE_MS, on the trailing edge, so a sustained drag
+// still updates live without a state write per pixel
+const DRAG_THROTTLE_MS = 60;
+let pendingRelayout = null;
+let relayoutTimer = null;
+
+function flushRelayout() {
+    const relayout = pendingRelayout;
+    pendingRelayout = null;
+    relayoutTimer = null;
+    window.dash_clientside.set_props("pz-relayout", {data: relayout});
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    pz: {
+        throttleRelayout: function (relayout) {
+            // Axis range / autoscale relayouts don't move any root
+            if (relayout && Object.keys(relayout).some(k => SHAPE_RE.test(k))) {
+                // Later edits to the same key supersede earlier ones
+                pendingRelayout = Object.assign(pendingRelayout || {}, relayout);
+                if (relayoutTimer === null) {
+                    relayoutTimer = setTimeout(flushRelayout, DRAG_THROTTLE_MS);
+                }
+            }
+            return window.dash_clientside.no_update;
+        },
+
+        applyDrag: function (relayout, data) {
+            if (!relayout) {
+                return window.dash_clientside.no_update;
+            }
+
+            // Group edge keys by shape first: each edge pair gives the same
+            // centre, so every moved root is written once per axis
+            const moves = new Map();
+            for (const key in relayout) {
+                const m = SHAPE_RE.exec(key);
+                const val = Number(relayout[key]);
+                if (m === null || !Number.isFinite(val)) {
+                    continue;
+                }
+                const i = Number(m[1]);
+                const edge = DRAG_EDGES[m[2]];
+                if (!moves.has(i)) {
+                    moves.set(i, {});
+                }
+                moves.get(i)[edge.axis] = val + edge.sign * PZ_RADIUS;
+            }
+            if (moves.size === 0) {
+                return window.dash_clientside.no_update;
+            }
+
+            const roots = {
+                zeros: {re: decodeArray(data.zeros_re), im: decodeArray(data.zeros_im)},
+                poles: {re: decodeArray(data.poles_re), im: decodeArray(data.poles_im)}
+            };
+            const nZeros = roots.zeros.re.length;
+            const nRoots = nZeros + roots.poles.re.length;
+
+            let moved = false;
+            for (const [i, centre] of moves) {
+                if (i >= nRoots) {
+                    continue;
+                }
+                const root = i < nZeros ? roots.zeros : roots.poles;
+                const j = i < nZeros ? i : i - nZeros;
+                if (centre.re !== undefined) {
+                    root.re[j] = centre.re;
+                }
+                if (centre.im !== undefined) {
+                    root.im[j] = centre.im;
+                }
+                moved = true;
+            }
+            if (!moved) {
+                return window.dash_clientside.no_update;
+            }
+
+            return {
+                poles_re: encodeArray(roots.poles.re), poles_im: encodeArray(roots.poles.im),
+                zeros_re: encodeArray(roots.zeros.re), zeros_im: encodeArray(roots.zeros.im),
+                gain: data.gain
+            };
+        },
+
+        renderBackground: function (domain, rocMode) {
+            const shapes = [];
+
+            // 1. Background Regions (Stability/Causality)
+            if (rocMode !== "off") {
+                if (domain === "analog") {
+                    shapes.push(rocMode === "causal" ? LHP_GREEN : RHP_RED);
+                } else {
+                    shapes.push(rocMode === "causal" ? UNIT_GREEN : UNIT_RED);
+                }
+            }
+
+            // 2. Reference Lines
+            shapes.push(domain === "digital" ? UNIT_REF : IMAG_AXIS_REF);
+
+            return {
+                data: [],
+                layout: Object.assign({shapes: shapes}, PZ_LAYOUT)
+            };
+        },
+
+        render: function (data) {
+            // 3. Zeros (Blue) and 4. Poles (Red)
+            const roots = {
+                zerosRe: decodeArray(data.zeros_re), zerosIm: decodeArray(data.zeros_im),
+                polesRe: decodeArray(data.poles_re), polesIm: decodeArray(data.poles_im)
+            };
+            const previous = renderedRoots;
+            renderedRoots = roots;
+
+            // Same root counts (e.g. a drag): patch only the moved markers
+            if (previous !== null &&
+                    previous.zerosRe.length === roots.zerosRe.length &&
+                    previous.polesRe.length === roots.polesRe.length) {
+                const patch = markerPatch(previous, roots);
+                return patch === null ? window.dash_clientside.no_update : patch;
+            }
+
+            return {
+                data: markerTraces(roots),
+                layout: Object.assign({
+                    shapes: markerShapes(roots),
+                    paper_bgcolor: "rgba(0, 0, 0, 0)",
+                    plot_bgcolor: "rgba(0, 0, 0, 0)",
+                    showlegend: false,
+                    hovermode: false,
+                    dragmode: "select"
+                }, PZ_LAYOUT)
+            };
+        }
+    }
+});
@@ -1,6 +1,246 @@
+import base64
+import logging
+import math
+
 import numpy as np
 from scipy import signal
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels fall back to NumPy/SciPy
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+
+def _zpk_response_py(s, zeros, poles, gain):
+    """Evaluate gain * prod(s - z) / prod(s - p) at each complex point s."""
+    h = np.empty(s.shape[0], dtype=np.complex128)
+    for k in range(s.shape[0]):
+        num = gain + 0j
+        for z in zeros:
+            num *= s[k] - z
+        den = 1.0 + 0j
+        for p in poles:
+            den *= s[k] - p
+        if den == 0:
+            # Numba's complex division raises here; give NumPy's
+            # componentwise inf/nan instead
+            h[k] = complex(num.real / 0.0, num.imag / 0.0)
+        else:
+            h[k] = num / den
+    return h
+
+
+# Kernels release the GIL so concurrent callbacks (threaded server workers)
+# run them side by side rather than queueing on the interpreter lock.
+# error_model="numpy" makes float division by zero give inf/nan, as in the
+# NumPy fallback, instead of raising ZeroDivisionError; fastmath stays off
+# for the response, which must produce inf at a root on the grid
+if njit is not None:
+    _zpk_response_njit = njit(cache=True, nogil=True,
+                              error_model="numpy")(_zpk_response_py)
+else:
+    _zpk_response_njit = None
+
+
+def zpk_response(zeros, poles, gain, s):
+    """Transfer function of a ZPK system at the complex points s, JIT-compiled
+    with Numba when available and a broadcast product otherwise."""
+    s = np.ascontiguousarray(s, dtype=np.complex128)
+    zeros = np.ascontiguousarray(zeros, dtype=np.complex128)
+    poles = np.ascontiguousarray(poles, dtype=np.complex128)
+    if _zpk_response_njit is not None:
+        return _zpk_response_njit(s, zeros, poles, float(gain))
+    num = np.prod(s - zeros[:, None], axis=0)
+    den = np.prod(s - poles[:, None], axis=0)
+    return gain * num / den
+
+
+def freqs_response(zeros, poles, gain, w):
+    """Analog frequency response H(jw) of a ZPK system."""
+    return zpk_response(zeros, poles, gain, 1j * np.asarray(w, dtype=np.float64))
+
+
+def _impulse_analog_py(t, r, p):
+    """Sum the two-sided residue terms r * e^(pt) over a time vector: causal
+    (u(t)) for left half plane poles, anticausal (-u(-t)) for the right."""
+    y = np.zeros(t.shape[0], dtype=np.complex128)
+    # Each pole is supported on one half of the time axis; classify the
+    # samples once so the inner loop has a single comparison
+    negative = t < 0
+    for i in range(p.shape[0]):
+        anticausal = p[i].real > 0
+        ri = -r[i] if anticausal else r[i]
+        for j in range(t.shape[0]):
+            if negative[j] == anticausal:
+                y[j] += ri * np.exp(p[i] * t[j])
+    return y
+
+
+if njit is not None:
+    _impulse_analog_njit = njit(cache=True, fastmath=True, nogil=True,
+                                error_model="numpy")(_impulse_analog_py)
+else:
+    _impulse_analog_njit = None
+
+
+def _bode_py(h):
+    """Magnitude (dB) and unwrapped phase (deg) of h in a single pass. The
+    unwrap follows np.unwrap: steps of at least pi are folded into
+    [-pi, pi)."""
+    n = h.shape[0]
+    mag = np.empty(n, dtype=np.float32)
+    phase = np.empty(n, dtype=np.float32)
+    prev = 0.0
+    offset = 0.0
+    for i in range(n):
+        re = h[i].real
+        im = h[i].imag
+        mag[i] = 20.0 * math.log10(max(math.hypot(re, im), 1e-15))
+        angle = math.atan2(im, re)
+        if i > 0:
+            d = angle - prev
+            if abs(d) >= math.pi:
+                dd = (d + math.pi) % (2.0 * math.pi) - math.pi
+                if dd == -math.pi and d > 0:
+                    dd = math.pi
+                offset += dd - d
+        prev = angle
+        phase[i] = math.degrees(angle + offset)
+    return mag, phase
+
+
+if njit is not None:
+    _bode_njit = njit(cache=True, nogil=True, error_model="numpy")(_bode_py)
+else:
+    _bode_njit = None
+
+
+def bode(h):
+    """Magnitude (dB) and unwrapped phase (deg) of a frequency response as
+    float32, fused into one JIT-compiled loop with Numba when available."""
+    if _bode_njit is not None:
+        return _bode_njit(np.ascontiguousarray(h, dtype=np.complex128))
+    # Floor |h| in place so log10(0) can't occur, without a second array
+    mag_db = np.abs(h)
+    np.maximum(mag_db, 1e-15, out=mag_db)
+    np.log10(mag_db, out=mag_db)
+    mag_db *= 20
+    mag_db = mag_db.astype(np.float32)
+    phase_deg = np.unwrap(np.angle(h))
+    phase_deg *= 180.0 / np.pi
+    phase_deg = phase_deg.astype(np.float32)
+    return mag_db, phase_deg
+
+
+def zpk_residues(zeros, poles, gain):
+    """Residues of a ZPK system at its poles, returned as (r, p).
+
+    For simple poles these come straight from the ZPK form,
+    r_i = k * prod(p_i - z) / prod(p_i - p_j), without expanding to
+    polynomials. Repeated poles fall back to signal.residue."""
+    zeros = np.asarray(zeros, dtype=np.complex128)
+    poles = np.asarray(poles, dtype=np.complex128)
+    diff = poles[:, None] - poles[None, :]
+    np.fill_diagonal(diff, 1.0)
+    scale = max(np.max(np.abs(poles), initial=0.0), 1.0)
+    if np.any(np.abs(diff) < 1e-9 * scale):
+        r, p, _ = signal.residue(*signal.zpk2tf(zeros, poles, gain))
+        return r, p
+    num = np.prod(poles[:, None] - zeros[None, :], axis=1)
+    return gain * num / np.prod(diff, axis=1), poles
+
+
+def impulse_analog(t, r, p):
+    """Two-sided analog impulse response from residues r at poles p,
+    JIT-compiled with Numba when available."""
+    if _impulse_analog_njit is not None:
+        return _impulse_analog_njit(np.ascontiguousarray(t, dtype=np.float64),
+                                    np.ascontiguousarray(r, dtype=np.complex128),
+                                    np.ascontiguousarray(p, dtype=np.complex128))
+    r = np.asarray(r, dtype=np.complex128)
+    p = np.asarray(p, dtype=np.complex128)
+    # Anticausal (Right Half Plane): -r * e^(pt) * u(-t)
+    # Causal (Left Half Plane): r * e^(pt) * u(t)
+    anticausal = p.real > 0
+    mask = anticausal[:, None] == (t < 0)
+    # Zero the exponent outside each pole's support so growing terms can't
+    # overflow to inf before the mask drops them
+    terms = np.exp(p[:, None] * np.where(mask, t, 0.0))
+    terms *= mask
+    return np.where(anticausal, -r, r) @ terms
+
+
+def _first_order_sos(zeros, poles, gain):
+    """Cascade of first-order sections (1 - z/x) / (1 - p/x), x = z^-1 here,
+    one root per section so unpaired complex roots are fine.
+
+    As with zpk2sos(pairing='nearest'), each pole, nearest the unit circle
+    first, shares its section with the nearest remaining zero. Arbitrary
+    pairing lets the intermediate signals of high-order designs grow until
+    the cascade loses all precision."""
+    n = max(len(zeros), len(poles), 1)
+    sos = np.zeros((n, 6), dtype=np.complex128)
+    sos[:, 0] = sos[:, 3] = 1.0
+    poles = poles[np.argsort(-np.abs(poles), kind="stable")]
+    remaining = np.asarray(zeros)
+    for i, p in enumerate(poles):
+        if not remaining.size:
+            break
+        j = np.argmin(np.abs(remaining - p))
+        sos[i, 1] = -remaining[j]
+        remaining = np.delete(remaining, j)
+    sos[len(poles):len(poles) + len(remaining), 1] = -remaining
+    sos[:len(poles), 4] = -poles
+    sos[0, :3] *= gain
+    return sos
+
+
+def impulse_digital(zeros, poles, gain, dim):
+    """Two-sided digital impulse response over n = -dim..dim, straight from
+    the ZPK form (as gain * prod(1 - z/x) / prod(1 - p/x), x = z^-1).
+
+    Poles inside the unit circle are causal and poles outside anticausal.
+    The causal factor (with all zeros and the gain) is run through a
+    first-order section cascade; the anticausal one is run time-reversed on
+    the reciprocal poles; the two-sided response is their convolution."""
+    zeros = np.asarray(zeros, dtype=np.complex128)
+    poles = np.asarray(poles, dtype=np.complex128)
+    outside = np.abs(poles) > 1.0000001
+    inner, q = poles[~outside], 1.0 / poles[outside]
+
+    # Both factors are IIR only when both pole sets are non-empty; then run
+    # them long enough for the slowest pole to decay before truncating
+    length = dim + 1 + len(zeros) + len(poles)
+    if len(inner) and len(q):
+        r_max = max(np.max(np.abs(inner)), np.max(np.abs(q)))
+        length += int(min(np.log(1e-9) / np.log(max(r_max, 1e-12)), 10000)) \
+            if r_max < 1 else 10000
+    delta = np.zeros(length)
+    delta[0] = 1.0
+
+    causal = signal.sosfilt(_first_order_sos(zeros, inner, gain), delta)
+    # 1 / prod(1 - p/x) = prod(-q) x^m / prod(1 - q x): reversed in time this
+    # is causal with poles q, delayed by m samples
+    m = len(q)
+    reversed_ = np.zeros(length, dtype=np.complex128)
+    reversed_[m:] = np.prod(-q) * signal.sosfilt(
+        _first_order_sos(np.empty(0), q, 1.0), delta)[:length - m]
+
+    # y[n] = sum_j reversed_[j] * causal[j + n]
+    full = signal.correlate(causal, np.conj(reversed_), mode="full")
+    return full[length - 1 - dim:length + dim]
+
+
+def warmup():
+    """Trigger JIT compilation of the Numba kernels ahead of the first
+    request."""
+    freqs_response(np.array([1j]), np.array([-1.0 + 0j]), 1.0, np.array([1.0]))
+    root = np.array([-1.0 + 0j])
+    impulse_analog(np.array([0.0]), root, root)
+    bode(np.array([1.0 + 0j]))
+
 
 def sanitize_json(obj):
     """Recursively convert numpy types to standard python types for JSON
@@ -18,151 +258,167 @@ def sanitize_json(obj):
     return obj
 
 
-def to_complex_array(data_list):
-    """Convert list of [real, imag] lists back to numpy complex array."""
-    if not data_list:
-        return np.array([])
-    return np.array([complex(x[0], x[1]) for x in data_list])
+_TYPED_ARRAY_DTYPES = {"f8": "<f8", "f4": "<f4"}
+
+
+def encode_array(arr, dtype="f8"):
+    """Encode a float array as a base64 typed array (Plotly's bdata
+    convention) for compact JSON transport."""
+    arr = np.ascontiguousarray(arr, dtype=_TYPED_ARRAY_DTYPES[dtype])
+    return {"dtype": dtype, "bdata": base64.b64encode(arr.tobytes()).decode("ascii")}
+
+
+def decode_array(obj):
+    """Inverse of encode_array; returns a read-only array."""
+    return np.frombuffer(base64.b64decode(obj["bdata"]),
+                         dtype=_TYPED_ARRAY_DTYPES[obj["dtype"]])
+
+
+def to_complex_array(re, im):
+    """Combine parallel lists of real and imaginary parts into a numpy complex
+    array."""
+    re = np.asarray(re, dtype=np.float64)
+    out = np.empty(re.shape, dtype=np.complex128)
+    # Fill the interleaved halves in place; avoids the 1j * im temporary
+    out.real = re
+    out.imag = im
+    return out
+
+
+def as_zpk(zeros, poles, gain):
+    """Normalize a ZPK triple to contiguous complex128 root arrays and a
+    float gain."""
+    return (np.ascontiguousarray(zeros, dtype=np.complex128),
+            np.ascontiguousarray(poles, dtype=np.complex128),
+            float(gain))
+
+
+# Filter family -> scipy design function, with the ripple (dB) and
+# stopband attenuation (dB) specs fixed for the UI
+_FAMILIES = {
+    "Butterworth": signal.butter,
+    "Chebyshev I": lambda N, Wn, **kw: signal.cheby1(N, 1, Wn, **kw),
+    "Chebyshev II": lambda N, Wn, **kw: signal.cheby2(N, 40, Wn, **kw),
+    "Elliptic": lambda N, Wn, **kw: signal.ellip(N, 1, 40, Wn, **kw),
+    "Bessel": signal.bessel,
+}
 
 
 def design_filter(family, ftype, order, domain, c1, c2):
-    """Wrapper for scipy.signal filter design functions."""
+    """Wrapper for scipy.signal filter design functions. Returns a
+    normalized (see as_zpk) triple."""
     analog = (domain == "analog")
 
-    # Frequency constraint logic
-    if ftype in ["bandpass", "bandstop"]:
-        Wn = [min(c1, c2), max(c1, c2)]
-    else:
-        Wn = c1
+    # Cleared or out-of-range inputs from the UI give an empty design
+    band = ftype in ["bandpass", "bandstop"]
+    if order is None or order < 1 or c1 is None or (band and c2 is None):
+        return as_zpk([], [], 1.0)
 
-    # Safety clamps
-    if not analog:
-        Wn = np.clip(Wn, 1e-6, 0.999)
+    # Frequency constraint logic with safety clamps. Plain min/max keeps
+    # Wn a Python float/list instead of a 0-d or small NumPy array
+    hi = math.inf if analog else 0.999
+    if band:
+        Wn = [min(max(c, 1e-6), hi) for c in sorted((c1, c2))]
     else:
-        Wn = np.maximum(Wn, 1e-6)
+        Wn = min(max(c1, 1e-6), hi)
+
+    design = _FAMILIES.get(family)
+    if design is None:
+        return as_zpk([], [], 1.0)
 
     try:
-        if family == "Butterworth":
-            z, p, k = signal.butter(order, Wn, btype=ftype, analog=analog, output='zpk')
-        elif family == "Chebyshev I":
-            z, p, k = signal.cheby1(order, 1, Wn, btype=ftype, analog=analog,
-                                    output='zpk')
-        elif family == "Chebyshev II":
-            z, p, k = signal.cheby2(order, 40, Wn, btype=ftype, analog=analog,
-                                    output='zpk')
-        elif family == "Elliptic":
-            z, p, k = signal.ellip(order, 1, 40, Wn, btype=ftype, analog=analog,
-                                   output='zpk')
-        elif family == "Bessel":
-            z, p, k = signal.bessel(order, Wn, btype=ftype, analog=analog, output='zpk')
-        else:
-            return [], [], 1.0
-    except Exception as e:
-        print(f"Filter Design Error: {e}")
-        return [], [], 1.0
+        z, p, k = design(order, Wn, btype=ftype, analog=analog, output='zpk')
+    # High orders the UI accepts make SciPy fail in root finding
+    # (RuntimeError) or overflow, besides its ValueErrors on bad specs
+    except (ValueError, RuntimeError, ArithmeticError) as e:
+        logger.warning("Filter design error: %s", e)
+        return as_zpk([], [], 1.0)
+
+    return as_zpk(z, p, k)
 
-    return z, p, k
+
+def _frozen(arr):
+    arr.setflags(write=False)
+    return arr
+
+
+# The digital grids don't depend on the filter, so they're built once rather
+# than reallocated on every call; those returned to callers are read-only
+_N_FREQ = 500
+_N_DIGITAL_IMPULSE = 50
+_DIGITAL_W = np.linspace(0, np.pi, _N_FREQ, endpoint=False)
+_DIGITAL_Z = np.exp(1j * _DIGITAL_W)
+_DIGITAL_W32 = _frozen(_DIGITAL_W.astype(np.float32))
+_DIGITAL_T32 = _frozen(np.arange(-_N_DIGITAL_IMPULSE, _N_DIGITAL_IMPULSE + 1,
+                                 dtype=np.float32))
 
 
 def compute_responses(zeros, poles, gain, domain):
     """Computes Frequency (Bode) and Impulse responses.
-       For Impulse Response, uses Partial Fraction Expansion to support
-       stable non-causal responses (two-sided).
+       Impulse responses are two-sided to support stable non-causal
+       systems: analog ones sum Partial Fraction Expansion terms, digital
+       ones filter the ZPK form directly (see impulse_digital).
     """
+    zeros, poles, gain = as_zpk(zeros, poles, gain)
     analog = (domain == "analog")
 
     # 1. Frequency Response
     if analog:
-        all_p = np.concatenate([np.abs(zeros), np.abs(poles)])
-        if len(all_p) > 0:
-            fmax = max(all_p) * 100
-            fmin = min(all_p[all_p > 0]) / 10 if any(all_p > 0) else 0.1
-        else:
-            fmin, fmax = 0.1, 100
+        # Root magnitudes bound the grid; one NumPy reduction each rather
+        # than Python max/min/any iterating over the array
+        all_p = np.abs(np.concatenate([zeros, poles]))
+        fmax = all_p.max() * 100 if all_p.size else 100
+        nonzero = all_p[all_p > 0]
+        fmin = nonzero.min() / 10 if nonzero.size else 0.1
 
         # logspace generation
-        w = np.logspace(np.log10(fmin), np.log10(fmax), 500)
-        w, h = signal.freqs_zpk(zeros, poles, gain, worN=w)
+        w = np.logspace(np.log10(fmin), np.log10(fmax), _N_FREQ)
+        h = freqs_response(zeros, poles, gain, w)
+        # Outputs are only plotted, so single precision halves their footprint
+        w = w.astype(np.float32)
     else:
-        w, h = signal.freqz_zpk(zeros, poles, gain, worN=500)
+        h = zpk_response(zeros, poles, gain, _DIGITAL_Z)
+        w = _DIGITAL_W32
 
-    mag_db = 20 * np.log10(np.abs(h) + 1e-15)
-    phase_deg = np.rad2deg(np.unwrap(np.angle(h)))
+    mag_db, phase_deg = bode(h)
 
     # 2. Impulse Response (Two-Sided / Stable)
     t, y = None, None
-    b, a = signal.zpk2tf(zeros, poles, gain)
 
     if analog:
         # Check properness: if Zeros > Poles, impulse is undefined (Dirac deltas)
         if len(zeros) > len(poles):
             return w, mag_db, phase_deg, None, None
-        
+
         try:
-            r, p, k = signal.residue(b, a)
-        except Exception:
+            r, p = zpk_residues(zeros, poles, gain)
+        except (ValueError, ArithmeticError) as e:
+            logger.warning("Residue calculation error: %s", e)
             return w, mag_db, phase_deg, None, None
 
         # Determine time range
-        real_p = np.real(p)
-        if len(real_p) > 0:
-             # Use the slowest decay (closest to axis) for range
-             min_decay = np.min(np.abs(real_p))
-             min_decay = max(min_decay, 0.1)
-             t_max = 5.0 / min_decay
+        # Use the slowest decay (closest to axis) for range
+        if p.size:
+            t_max = 5.0 / max(np.abs(p.real).min(), 0.1)
         else:
-             t_max = 10.0
+            t_max = 10.0
         
         # Create symmetric time vector to show both sides
         t = np.linspace(-t_max, t_max, 1000)
-        y = np.zeros_like(t, dtype=np.complex128)
 
         # 1. Add Residue terms
-        for ri, pi in zip(r, p):
-            if np.real(pi) > 0:
-                # Anticausal (Right Half Plane): -r * e^(pt) * u(-t)
-                mask = t < 0
-                y[mask] -= ri * np.exp(pi * t[mask])
-            else:
-                # Causal (Left Half Plane): r * e^(pt) * u(t)
-                mask = t >= 0
-                y[mask] += ri * np.exp(pi * t[mask])
-        
+        y = impulse_analog(t, r, p)
+
         # Add direct term k if present (though usually delta function)
         # For visualization, we skip drawing the delta arrow for now.
         y = np.real(y)
+        t = t.astype(np.float32)
 
     else:
-        # Digital
-        try:
-            r, p, k = signal.residuez(b, a)
-        except Exception:
-             return w, mag_db, phase_deg, None, None
-        
         # Digital Time Vector: -50 to +50
-        dim = 50
-        t = np.arange(-dim, dim + 1)
-        y = np.zeros_like(t, dtype=np.complex128)
-
-        # 1. Direct terms (k)
-        for i, val in enumerate(k):
-            # delta at n=i. t vector starts at -dim.
-            # Index in 'y' corresponding to n=i is i + dim
-            idx = i + dim
-            if 0 <= idx < len(y):
-                y[idx] += val
-        
-        # 2. Residue terms
-        for ri, pi in zip(r, p):
-            if abs(pi) > 1.0000001: 
-                # Anticausal: -r * p^n * u[-n-1]
-                mask = t <= -1
-                y[mask] -= ri * (pi ** t[mask])
-            else:
-                # Causal: r * p^n * u[n]
-                mask = t >= 0
-                y[mask] += ri * (pi ** t[mask])
+        t = _DIGITAL_T32
+        y = impulse_digital(zeros, poles, gain, _N_DIGITAL_IMPULSE)
 
         y = np.real(y)
 
-    return w, mag_db, phase_deg, t, y
+    return w, mag_db, phase_deg, t, y.astype(np.float32)